@@ -1,7 +1,272 @@
 
+import functools
+
 import numpy as np
-import skfuzzy as fuzz
-from skfuzzy import control as ctrl
+from numba import njit, prange
+
+
+def _clamp01(x):
+    """
+    Clamp a scalar to [0, 1] without the ufunc dispatch and array round-trip
+    of np.clip on a Python float.
+    """
+    x = float(x)
+    return 0.0 if x < 0.0 else 1.0 if x > 1.0 else x
+
+
+def _sample_trimf(universe, a, b, c):
+    """
+    Sample a triangular MF with breakpoints (a, b, c) over a universe array.
+    """
+    left = np.ones_like(universe) if b <= a else (universe - a) / (b - a)
+    right = np.ones_like(universe) if c <= b else (c - universe) / (c - b)
+    return np.maximum(0.0, np.minimum(left, right))
+
+
+@njit(cache=True, fastmath=True)
+def _trimf_scalar(x, a, inv_ba, c, inv_cb):
+    """
+    Branchless scalar triangular membership: max(0, min(left, right)) with
+    the slope reciprocals precomputed, so the hot path is two FMAs and two
+    min/max instructions with no data-dependent branches.
+    """
+    return max(0.0, min((x - a) * inv_ba, (c - x) * inv_cb))
+
+
+@njit(cache=True, fastmath=True)
+def _fis_eval_core(
+    fe, vc, cc, mf_coeffs, rule_inputs, rule_out, mfs, universe, out_centroids, height
+):
+    """
+    Compiled Mamdani inference core: memberships, rule firings,
+    max-aggregation and defuzzification (centroid, or height when the flag
+    is set) in one pass.
+    """
+    xs = np.empty(3)
+    xs[0] = fe
+    xs[1] = vc
+    xs[2] = cc
+
+    n_terms = mf_coeffs.shape[0]
+    mu = np.empty((3, n_terms))
+    for i in range(3):
+        for t in range(n_terms):
+            mu[i, t] = _trimf_scalar(
+                xs[i],
+                mf_coeffs[t, 0],
+                mf_coeffs[t, 1],
+                mf_coeffs[t, 2],
+                mf_coeffs[t, 3],
+            )
+
+    n_out = mfs.shape[0]
+    acts = np.zeros(n_out)
+    for r in range(rule_inputs.shape[0]):
+        firing = 1.0
+        for v in range(3):
+            t = rule_inputs[r, v]
+            if t >= 0 and mu[v, t] < firing:
+                firing = mu[v, t]
+        out = rule_out[r]
+        if firing > acts[out]:
+            acts[out] = firing
+
+    num = 0.0
+    den = 0.0
+    if height:
+        for j in range(n_out):
+            num += acts[j] * out_centroids[j]
+            den += acts[j]
+        return num / (den + 1e-12)
+
+    for k in range(universe.shape[0]):
+        agg = 0.0
+        for j in range(n_out):
+            m = mfs[j, k]
+            if acts[j] < m:
+                m = acts[j]
+            if m > agg:
+                agg = m
+        num += universe[k] * agg
+        den += agg
+    return num / (den + 1e-12)
+
+
+@njit(cache=True, fastmath=True)
+def _fis_eval_core_q15(
+    fe,
+    vc,
+    cc,
+    mf_coeffs,
+    rule_inputs,
+    rule_out,
+    mfs_q15,
+    universe_q15,
+    out_centroids,
+    height,
+):
+    """
+    Fixed-point variant of _fis_eval_core. Memberships are quantized to
+    Q1.15 after the (float) triangular formulas, and the rule min/max plus
+    the aggregation loop run on integer lanes over the int16 tables;
+    min/max and the weighted sum are exact in fixed point, so floats only
+    reappear at the final division.
+    """
+    xs = np.empty(3)
+    xs[0] = fe
+    xs[1] = vc
+    xs[2] = cc
+
+    n_terms = mf_coeffs.shape[0]
+    mu = np.empty((3, n_terms), np.int32)
+    for i in range(3):
+        for t in range(n_terms):
+            m = _trimf_scalar(
+                xs[i],
+                mf_coeffs[t, 0],
+                mf_coeffs[t, 1],
+                mf_coeffs[t, 2],
+                mf_coeffs[t, 3],
+            )
+            mu[i, t] = np.int32(m * 32767.0 + 0.5)
+
+    n_out = mfs_q15.shape[0]
+    acts = np.zeros(n_out, np.int32)
+    for r in range(rule_inputs.shape[0]):
+        firing = np.int32(32767)
+        for v in range(3):
+            t = rule_inputs[r, v]
+            if t >= 0 and mu[v, t] < firing:
+                firing = mu[v, t]
+        out = rule_out[r]
+        if firing > acts[out]:
+            acts[out] = firing
+
+    if height:
+        num = 0.0
+        den = 0.0
+        for j in range(n_out):
+            num += acts[j] * out_centroids[j]
+            den += acts[j]
+        return num / (den + 1e-12)
+
+    num = np.int64(0)
+    den = np.int64(0)
+    for k in range(universe_q15.shape[0]):
+        agg = np.int64(0)
+        for j in range(n_out):
+            m = np.int64(mfs_q15[j, k])
+            a = np.int64(acts[j])
+            if a < m:
+                m = a
+            if m > agg:
+                agg = m
+        num += np.int64(universe_q15[k]) * agg
+        den += agg
+    if den == 0:
+        return 0.0
+    return (num / den) / 3276.7
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _fis_batch_core(
+    X,
+    mf_coeffs,
+    rule_inputs,
+    rule_out,
+    mfs,
+    universe,
+    out_centroids,
+    height,
+    crisp,
+    label_idx,
+):
+    """
+    Parallel batch wrapper over _fis_eval_core: rows of X are independent,
+    so they are distributed over threads with prange. Also resolves the
+    dominant label per point through the same fractional-index gather as
+    the scalar path.
+    """
+    n_u = universe.shape[0]
+    scale = (n_u - 1) / universe[n_u - 1]
+    for i in prange(X.shape[0]):
+        c = _fis_eval_core(
+            X[i, 0],
+            X[i, 1],
+            X[i, 2],
+            mf_coeffs,
+            rule_inputs,
+            rule_out,
+            mfs,
+            universe,
+            out_centroids,
+            height,
+        )
+        crisp[i] = c
+
+        pos = c * scale
+        k = int(pos)
+        if k > n_u - 2:
+            k = n_u - 2
+        frac = pos - k
+        best = 0
+        best_val = -1.0
+        for j in range(mfs.shape[0]):
+            val = mfs[j, k] * (1.0 - frac) + mfs[j, k + 1] * frac
+            if val > best_val:
+                best_val = val
+                best = j
+        label_idx[i] = best
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _fis_batch_core_q15(
+    X,
+    mf_coeffs,
+    rule_inputs,
+    rule_out,
+    mfs_q15,
+    universe_q15,
+    out_centroids,
+    height,
+    crisp,
+    label_idx,
+):
+    """
+    Fixed-point counterpart of _fis_batch_core, dispatching rows to
+    _fis_eval_core_q15 and picking labels by the same fractional-index
+    gather over the int16 MF table.
+    """
+    n_u = universe_q15.shape[0]
+    scale = (n_u - 1) * 3276.7 / universe_q15[n_u - 1]
+    for i in prange(X.shape[0]):
+        c = _fis_eval_core_q15(
+            X[i, 0],
+            X[i, 1],
+            X[i, 2],
+            mf_coeffs,
+            rule_inputs,
+            rule_out,
+            mfs_q15,
+            universe_q15,
+            out_centroids,
+            height,
+        )
+        crisp[i] = c
+
+        pos = c * scale
+        k = int(pos)
+        if k > n_u - 2:
+            k = n_u - 2
+        frac = pos - k
+        best = 0
+        best_val = -1.0
+        for j in range(mfs_q15.shape[0]):
+            val = mfs_q15[j, k] * (1.0 - frac) + mfs_q15[j, k + 1] * frac
+            if val > best_val:
+                best_val = val
+                best = j
+        label_idx[i] = best
 
 
 class FuzzyAnomalyDetector:
@@ -15,163 +280,259 @@ class FuzzyAnomalyDetector:
 
     Output:
         - anomaly_level: anomaly level in [0, 10]
+
+    Parameters:
+        defuzz (str): defuzzification method. "centroid" (default) takes the
+            centroid of the max-aggregated output surface over the 101-point
+            universe; "height" collapses each consequent to its precomputed
+            triangle centroid weighted by activation, skipping the
+            universe-wide aggregation at a small accuracy cost.
+        quantized (bool): when True, store the MF tables and universe as
+            int16 Q1.15 fixed point and run inference on integer min/max
+            lanes, halving table footprint and doubling SIMD width; crisp
+            values shift by at most the ~3e-5 quantization step.
     """
 
-    def __init__(self):
-        self.forecast_error = ctrl.Antecedent(np.linspace(0, 1, 101), "forecast_error")
-        self.variance_change = ctrl.Antecedent(np.linspace(0, 1, 101), "variance_change")
-        self.correlation_change = ctrl.Antecedent(np.linspace(0, 1, 101), "correlation_change")
+    INPUT_TERMS = ("low", "medium", "high")
+    OUTPUT_TERMS = (
+        "normal",
+        "slightly_anomalous",
+        "moderately_anomalous",
+        "strongly_anomalous",
+    )
+
+    # (a, b, c) breakpoints of the triangular MFs shared by all three inputs.
+    _INPUT_MF_PARAMS = (
+        (0.0, 0.0, 0.4),
+        (0.2, 0.5, 0.8),
+        (0.6, 1.0, 1.0),
+    )
 
-        self.anomaly_level = ctrl.Consequent(np.linspace(0, 10, 101), "anomaly_level")
+    # (a, b, c) breakpoints of the output triangles, one per OUTPUT_TERMS.
+    _OUTPUT_MF_PARAMS = (
+        (0.0, 0.0, 3.0),
+        (1.0, 3.0, 5.0),
+        (3.0, 5.0, 7.0),
+        (6.0, 10.0, 10.0),
+    )
+
+    def __init__(self, defuzz="centroid", quantized=False):
+        if defuzz not in ("centroid", "height"):
+            raise ValueError(f"unknown defuzzification method: {defuzz!r}")
+        self.defuzz = defuzz
+        self.quantized = quantized
 
         self._define_membership_functions()
         self._define_rules()
-        self._build_control_system()
+        self._build_evaluator()
+
+        # Per-instance memo of quantized evaluations: adjacent windows in a
+        # stream produce nearly identical indicator triples, so most calls
+        # become a dict lookup. Bound here rather than decorating the method
+        # so the cache does not outlive (or share across) instances.
+        self._cached_eval = functools.lru_cache(maxsize=10_000)(self._evaluate_key)
 
     def _define_membership_functions(self):
         """
         Define membership functions for all linguistic variables.
-        """
 
-        for var in [self.forecast_error, self.variance_change, self.correlation_change]:
-            var["low"] = fuzz.trimf(var.universe, [0.0, 0.0, 0.4])
-            var["medium"] = fuzz.trimf(var.universe, [0.2, 0.5, 0.8])
-            var["high"] = fuzz.trimf(var.universe, [0.6, 1.0, 1.0])
-
-        self.anomaly_level["normal"] = fuzz.trimf(self.anomaly_level.universe, [0, 0, 3])
-        self.anomaly_level["slightly_anomalous"] = fuzz.trimf(
-            self.anomaly_level.universe, [1, 3, 5]
-        )
-        self.anomaly_level["moderately_anomalous"] = fuzz.trimf(
-            self.anomaly_level.universe, [3, 5, 7]
-        )
-        self.anomaly_level["strongly_anomalous"] = fuzz.trimf(
-            self.anomaly_level.universe, [6, 10, 10]
+        The three inputs share the low/medium/high triangles over [0, 1];
+        the output terms are triangles over the [0, 10] anomaly universe,
+        sampled on 101 points for aggregation and defuzzification.
+        """
+        self._universe = np.linspace(0, 10, 101)
+        self._mfs = np.stack(
+            [_sample_trimf(self._universe, a, b, c) for a, b, c in self._OUTPUT_MF_PARAMS]
         )
 
     def _define_rules(self):
         """
         Define the fuzzy rule base (Mamdani).
-        """
-
-        fe = self.forecast_error
-        vc = self.variance_change
-        cc = self.correlation_change
-        al = self.anomaly_level
 
-        rules = []
-
-        rules.append(
-            ctrl.Rule(
-                fe["low"] & vc["low"] & cc["low"],
-                al["normal"],
-                label="R1_normal_all_low",
-            )
-        )
-
-        rules.append(
-            ctrl.Rule(
-                fe["medium"] & vc["low"] & cc["low"],
-                al["slightly_anomalous"],
-                label="R2_slightly_anom_medium_fe",
-            )
-        )
-        rules.append(
-            ctrl.Rule(
-                fe["low"] & vc["medium"] & cc["low"],
-                al["slightly_anomalous"],
-                label="R3_slightly_anom_medium_vc",
-            )
+        Each row of the rule table gives the term index (into INPUT_TERMS)
+        of (forecast_error, variance_change, correlation_change); -1 marks
+        an antecedent the rule does not use. Antecedents are combined by
+        min-conjunction.
+        """
+        self._rule_inputs = np.array(
+            [
+                [0, 0, 0],  # R1: low fe & low vc & low cc
+                [1, 0, 0],  # R2: medium fe & low vc & low cc
+                [0, 1, 0],  # R3: low fe & medium vc & low cc
+                [0, 0, 1],  # R4: low fe & low vc & medium cc
+                [1, 1, -1],  # R5: medium fe & medium vc
+                [1, -1, 1],  # R6: medium fe & medium cc
+                [-1, 1, 1],  # R7: medium vc & medium cc
+                [2, 2, -1],  # R8: high fe & high vc
+                [2, -1, 2],  # R9: high fe & high cc
+                [-1, 2, 2],  # R10: high vc & high cc
+                [2, 1, -1],  # R11: high fe & medium vc
+                [1, 2, -1],  # R12: medium fe & high vc
+                [2, -1, 1],  # R13: high fe & medium cc
+                [-1, 2, 1],  # R14: high vc & medium cc
+            ],
+            dtype=np.int8,
         )
-        rules.append(
-            ctrl.Rule(
-                fe["low"] & vc["low"] & cc["medium"],
-                al["slightly_anomalous"],
-                label="R4_slightly_anom_medium_cc",
-            )
+        # Consequent index (into OUTPUT_TERMS) of each rule: R1 -> normal,
+        # R2-R4 -> slightly, R5-R7 -> moderately, R8-R14 -> strongly.
+        self._rule_out = np.array(
+            [0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 3, 3, 3, 3], dtype=np.int8
         )
 
-        rules.append(
-            ctrl.Rule(
-                fe["medium"] & vc["medium"],
-                al["moderately_anomalous"],
-                label="R5_moderate_fe_vc",
-            )
-        )
-        rules.append(
-            ctrl.Rule(
-                fe["medium"] & cc["medium"],
-                al["moderately_anomalous"],
-                label="R6_moderate_fe_cc",
-            )
-        )
-        rules.append(
-            ctrl.Rule(
-                vc["medium"] & cc["medium"],
-                al["moderately_anomalous"],
-                label="R7_moderate_vc_cc",
-            )
+    def _build_evaluator(self):
+        """
+        Precompute the arrays used by the direct Mamdani evaluator.
+        """
+        # Single-precision, C-contiguous copies: the evaluator is bound by
+        # memory traffic over these arrays, and float32 halves the bytes per
+        # cache line while doubling SIMD lanes.
+        self._universe = np.ascontiguousarray(self._universe, dtype=np.float32)
+        self._mfs = np.ascontiguousarray(self._mfs, dtype=np.float32)
+        # Centroid of each output triangle (mean of its vertices), used by
+        # height defuzzification.
+        self._out_centroids = np.array(
+            [(a + b + c) / 3.0 for a, b, c in self._OUTPUT_MF_PARAMS],
+            dtype=np.float32,
         )
+        # Branchless MF coefficients: one (a, 1/(b-a), c, 1/(c-b)) row per
+        # input term. Shoulder terms (b == a or c == b) are folded into a
+        # unit slope through the peak; inputs are clipped to [0, 1], so the
+        # synthetic slope is never sampled on the wrong side of the peak.
+        coeffs = np.empty((len(self._INPUT_MF_PARAMS), 4), dtype=np.float32)
+        for i, (a, b, c) in enumerate(self._INPUT_MF_PARAMS):
+            coeffs[i, 0] = a if b > a else b - 1.0
+            coeffs[i, 1] = 1.0 / (b - a) if b > a else 1.0
+            coeffs[i, 2] = c if c > b else b + 1.0
+            coeffs[i, 3] = 1.0 / (c - b) if c > b else 1.0
+        self._in_mf_coeffs = coeffs
 
-        rules.append(
-            ctrl.Rule(
-                fe["high"] & vc["high"],
-                al["strongly_anomalous"],
-                label="R8_strong_fe_vc",
+        if self.quantized:
+            # Q1.15 fixed-point tables: memberships map [0, 1] to 0..32767
+            # and the universe is scaled so its top lands exactly on 32767.
+            self._mfs_q15 = np.ascontiguousarray(
+                np.round(self._mfs * 32767.0), dtype=np.int16
             )
-        )
-        rules.append(
-            ctrl.Rule(
-                fe["high"] & cc["high"],
-                al["strongly_anomalous"],
-                label="R9_strong_fe_cc",
+            self._universe_q15 = np.ascontiguousarray(
+                np.round(self._universe.astype(np.float64) * 3276.7),
+                dtype=np.int16,
             )
-        )
-        rules.append(
-            ctrl.Rule(
-                vc["high"] & cc["high"],
-                al["strongly_anomalous"],
-                label="R10_strong_vc_cc",
-            )
-        )
+            self._eval = self._eval_quantized
+            self._eval(0.0, 0.0, 0.0)
+        else:
+            self._emit_specialized()
 
-        rules.append(
-            ctrl.Rule(
-                fe["high"] & vc["medium"],
-                al["strongly_anomalous"],
-                label="R11_high_fe_medium_vc",
+        # Warm up the batch kernel too, so the first evaluate_batch call
+        # does not pay compilation.
+        if self.quantized:
+            _fis_batch_core_q15(
+                np.zeros((1, 3)),
+                self._in_mf_coeffs,
+                self._rule_inputs,
+                self._rule_out,
+                self._mfs_q15,
+                self._universe_q15,
+                self._out_centroids,
+                self.defuzz == "height",
+                np.empty(1),
+                np.empty(1, dtype=np.intp),
             )
-        )
-        rules.append(
-            ctrl.Rule(
-                fe["medium"] & vc["high"],
-                al["strongly_anomalous"],
-                label="R12_medium_fe_high_vc",
+        else:
+            _fis_batch_core(
+                np.zeros((1, 3)),
+                self._in_mf_coeffs,
+                self._rule_inputs,
+                self._rule_out,
+                self._mfs,
+                self._universe,
+                self._out_centroids,
+                self.defuzz == "height",
+                np.empty(1),
+                np.empty(1, dtype=np.intp),
             )
+
+    def _eval_quantized(self, fe, vc, cc):
+        """
+        Scalar entry point of the fixed-point core, bound to self._eval when
+        the detector is constructed with quantized=True.
+        """
+        return _fis_eval_core_q15(
+            fe,
+            vc,
+            cc,
+            self._in_mf_coeffs,
+            self._rule_inputs,
+            self._rule_out,
+            self._mfs_q15,
+            self._universe_q15,
+            self._out_centroids,
+            self.defuzz == "height",
         )
-        rules.append(
-            ctrl.Rule(
-                fe["high"] & cc["medium"],
-                al["strongly_anomalous"],
-                label="R13_high_fe_medium_cc",
+
+    def _emit_specialized(self):
+        """
+        Generate and JIT-compile an evaluator specialized to the current
+        rule base and MF breakpoints.
+
+        The rule table and breakpoints are fixed at construction time, so
+        instead of re-reading them through array indexing on every call we
+        emit Python source with every membership slope and rule conjunction
+        inlined as literals and let the JIT constant-fold the result. The
+        output MF table and universe are bound as globals of the generated
+        function, which Numba freezes to compile-time constants.
+        """
+        names = ("fe", "vc", "cc")
+        lines = ["def _eval(fe, vc, cc):"]
+
+        for var in names:
+            for term, (a, b, c) in zip(self.INPUT_TERMS, self._INPUT_MF_PARAMS):
+                left = "1.0" if b <= a else f"({var} - {a!r}) * {1.0 / (b - a)!r}"
+                right = "1.0" if c <= b else f"({c!r} - {var}) * {1.0 / (c - b)!r}"
+                lines.append(f"    {var}_{term} = max(0.0, min({left}, {right}))")
+
+        n_out = len(self.OUTPUT_TERMS)
+        for j in range(n_out):
+            conjunctions = []
+            for r in np.flatnonzero(self._rule_out == j):
+                cells = [
+                    f"{names[v]}_{self.INPUT_TERMS[t]}"
+                    for v, t in enumerate(self._rule_inputs[r])
+                    if t >= 0
+                ]
+                conjunctions.append(
+                    cells[0] if len(cells) == 1 else f"min({', '.join(cells)})"
+                )
+            body = (
+                conjunctions[0]
+                if len(conjunctions) == 1
+                else f"max({', '.join(conjunctions)})"
             )
-        )
-        rules.append(
-            ctrl.Rule(
-                vc["high"] & cc["medium"],
-                al["strongly_anomalous"],
-                label="R14_high_vc_medium_cc",
+            lines.append(f"    act{j} = {body}")
+
+        if self.defuzz == "height":
+            num = " + ".join(
+                f"act{j} * {float(self._out_centroids[j])!r}" for j in range(n_out)
             )
-        )
+            den = " + ".join(f"act{j}" for j in range(n_out))
+            lines.append(f"    return ({num}) / ({den} + 1e-12)")
+        else:
+            aggregate = ", ".join(f"min(_MFS[{j}, k], act{j})" for j in range(n_out))
+            lines += [
+                "    num = 0.0",
+                "    den = 0.0",
+                f"    for k in range({self._universe.shape[0]}):",
+                f"        agg = max({aggregate})",
+                "        num += _UNIVERSE[k] * agg",
+                "        den += agg",
+                "    return num / (den + 1e-12)",
+            ]
 
-        self.rules = rules
+        namespace = {"_MFS": self._mfs, "_UNIVERSE": self._universe}
+        exec("\n".join(lines), namespace)
+        self._eval = njit(fastmath=True)(namespace["_eval"])
 
-    def _build_control_system(self):
-        """
-        Build the fuzzy control system and simulator.
-        """
-        system = ctrl.ControlSystem(self.rules)
-        self.simulator = ctrl.ControlSystemSimulation(system)
+        # Warm up the JIT so compilation cost is paid here, not on the first
+        # evaluate() call.
+        self._eval(0.0, 0.0, 0.0)
 
     def evaluate(self, forecast_error, variance_change, correlation_change):
         """
@@ -185,26 +546,93 @@ class FuzzyAnomalyDetector:
         Returns:
             crisp_value (float): defuzzified anomaly level (0 to 10)
             label (str): dominant linguistic label
-        """
-        fe = float(np.clip(forecast_error, 0.0, 1.0))
-        vc = float(np.clip(variance_change, 0.0, 1.0))
-        cc = float(np.clip(correlation_change, 0.0, 1.0))
 
-        self.simulator.input["forecast_error"] = fe
-        self.simulator.input["variance_change"] = vc
-        self.simulator.input["correlation_change"] = cc
+        Inputs are quantized to a 0.01 grid and results memoized, so the
+        near-identical triples produced by adjacent stream windows resolve
+        to a cache lookup instead of a full inference.
+        """
+        fe = _clamp01(forecast_error)
+        vc = _clamp01(variance_change)
+        cc = _clamp01(correlation_change)
 
-        self.simulator.compute()
+        return self._cached_eval((round(fe * 100), round(vc * 100), round(cc * 100)))
 
-        crisp_value = float(self.simulator.output["anomaly_level"])
+    def _evaluate_key(self, key):
+        """
+        Run the full inference for one quantized (fe, vc, cc) key; cached
+        per instance through the lru_cache wrapper bound in __init__.
+        """
+        fe, vc, cc = (k / 100.0 for k in key)
 
-        membership_values = {
-            name: fuzz.interp_membership(
-                self.anomaly_level.universe, self.anomaly_level[name].mf, crisp_value
-            )
-            for name in self.anomaly_level.terms
-        }
+        crisp_value = float(self._eval(fe, vc, cc))
 
-        label = max(membership_values, key=membership_values.get)
+        # The universe is uniform, so all four term memberships at the crisp
+        # point come from one fractional-index gather instead of a per-term
+        # interpolation call and dict argmax.
+        n = self._universe.shape[0]
+        pos = crisp_value * (n - 1) / float(self._universe[-1])
+        k = min(int(pos), n - 2)
+        frac = pos - k
+        memberships = self._mfs[:, k] * (1.0 - frac) + self._mfs[:, k + 1] * frac
+        label = self.OUTPUT_TERMS[int(np.argmax(memberships))]
 
         return crisp_value, label
+
+    def evaluate_batch(self, forecast_error, variance_change, correlation_change):
+        """
+        Evaluate the FIS for arrays of normalized indicators.
+
+        Each point is independent, so the batch is distributed over threads
+        by a parallel compiled kernel instead of paying the per-call
+        inference overhead N times.
+
+        Parameters:
+            forecast_error (array-like): normalized forecast errors [0, 1]
+            variance_change (array-like): normalized variance changes [0, 1]
+            correlation_change (array-like): normalized correlation changes [0, 1]
+
+        Returns:
+            crisp_values (ndarray): defuzzified anomaly levels, shape (N,)
+            labels (list of str): dominant linguistic label per point
+        """
+        X = np.stack(
+            [
+                np.asarray(forecast_error, dtype=float),
+                np.asarray(variance_change, dtype=float),
+                np.asarray(correlation_change, dtype=float),
+            ],
+            axis=1,
+        )
+        np.clip(X, 0.0, 1.0, out=X)
+
+        crisp_values = np.empty(X.shape[0])
+        label_idx = np.empty(X.shape[0], dtype=np.intp)
+        if self.quantized:
+            _fis_batch_core_q15(
+                X,
+                self._in_mf_coeffs,
+                self._rule_inputs,
+                self._rule_out,
+                self._mfs_q15,
+                self._universe_q15,
+                self._out_centroids,
+                self.defuzz == "height",
+                crisp_values,
+                label_idx,
+            )
+        else:
+            _fis_batch_core(
+                X,
+                self._in_mf_coeffs,
+                self._rule_inputs,
+                self._rule_out,
+                self._mfs,
+                self._universe,
+                self._out_centroids,
+                self.defuzz == "height",
+                crisp_values,
+                label_idx,
+            )
+        labels = [self.OUTPUT_TERMS[i] for i in label_idx]
+
+        return crisp_values, labels